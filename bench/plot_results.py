@@ -4,6 +4,7 @@
 #     "pandas>=2.0",
 #     "seaborn>=0.13",
 #     "matplotlib>=3.8",
+#     "pyarrow>=14",
 # ]
 # ///
 """
@@ -19,17 +20,31 @@ Usage:
 Output:
     <results_dir>/benchmark_report.png  (300 DPI)
     <results_dir>/benchmark_report.svg
+
+Parsed CSV data is cached in <results_dir>/.plot_cache_*.feather and reused
+while the source files are unchanged (same paths and mtimes).
 """
 
 import argparse
 import glob
+import hashlib
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import matplotlib
+
+matplotlib.use("Agg")  # batch report generator: never pick up a GUI backend
 
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
 import seaborn as sns
+from matplotlib.lines import Line2D
 
 # ── Theme & Palette ──────────────────────────────────────────────────
 
@@ -83,6 +98,8 @@ def setup_style():
         "legend.facecolor": BG_COLOR,
         "legend.edgecolor": PALETTE["grid"],
         "legend.framealpha": 0.8,
+        # Split long line paths so Agg strokes them in bounded chunks
+        "agg.path.chunksize": 10000,
     })
 
 
@@ -108,6 +125,222 @@ def bytes_format(num, pos=None):
 
 # ── Data Loading ─────────────────────────────────────────────────────
 
+# Explicit CSV schemas (see client/src/metrics.rs and benchmark_monitor/monitor.sh).
+# Per-second counters and gauges fit in int32/float32; timestamps, cumulative
+# counters and byte rates (multi-GB/s NICs) keep 64 bits. Server columns are
+# parsed as int64 and only narrowed when the values fit (see narrow_columns).
+CLIENT_COLUMN_TYPES = {
+    "timestamp": pa.int64(),
+    "active": pa.int32(),
+    "failed": pa.int32(),
+    "tx_pixels": pa.int64(),
+    "tx_pps": pa.int32(),
+    "rx_dgram_s": pa.int32(),
+    "rx_mbps": pa.float32(),
+}
+
+SERVER_COLUMN_TYPES = {
+    "timestamp": pa.int64(),
+    **{
+        col: pa.int32()
+        for col in (
+            "cpu_user", "cpu_nice", "cpu_system", "cpu_idle",
+            "cpu_iowait", "cpu_irq", "cpu_softirq",
+            "udp_in_dgrams", "udp_out_dgrams", "udp_in_errors",
+            "udp_rcvbuf_errors", "udp_sndbuf_errors",
+            "net_rx_packets", "net_tx_packets",
+            "net_rx_drops", "net_tx_drops",
+            "server_rss_kb", "server_vsz_kb",
+            "ctx_switches", "interrupts",
+            "tcp_mem_pages", "udp_mem_pages",
+            "softnet_processed", "softnet_dropped", "softnet_time_squeeze",
+        )
+    },
+    "net_rx_bytes": pa.int64(),
+    "net_tx_bytes": pa.int64(),
+}
+
+# Numeric (summable/plottable) columns, known from the schemas above so no
+# dtype scan is needed; tx_pixels_s is derived in load_client_data.
+CLIENT_NUM_COLS = (
+    *(c for c in CLIENT_COLUMN_TYPES if c != "timestamp"),
+    "tx_pixels_s",
+)
+SERVER_NUM_COLS = tuple(c for c in SERVER_COLUMN_TYPES if c != "timestamp")
+
+
+def csv_options(column_types):
+    """pyarrow.csv reader options shared by the client and server loaders.
+
+    Rows with the wrong column count are skipped: killing monitor.sh or a
+    client mid-write leaves a truncated last line.
+    """
+    return {
+        "read_options": pv.ReadOptions(use_threads=True),
+        "parse_options": pv.ParseOptions(invalid_row_handler=lambda row: "skip"),
+        "convert_options": pv.ConvertOptions(column_types=column_types),
+    }
+
+
+def read_csv_table(path, column_types):
+    """Parse a metrics CSV into an Arrow table (multithreaded, typed)."""
+    return pv.read_csv(path, **csv_options(column_types))
+
+
+def narrow_columns(table, column_types):
+    """Cast columns to their `column_types` entry wherever every value fits."""
+    for i, name in enumerate(table.column_names):
+        narrow = column_types.get(name)
+        if narrow is None or table.schema.field(i).type == narrow:
+            continue
+        try:
+            table = table.set_column(i, name, table.column(i).cast(narrow))
+        except pa.ArrowInvalid:
+            pass  # out of range for the narrow type: keep it wide
+    return table
+
+
+def contiguous_columns(df, cols):
+    """Rematerialize numeric `cols` as C-contiguous numpy arrays.
+
+    Every plot panel re-reads these columns; doing the Arrow → numpy
+    conversion once here keeps those accesses cheap and cache-friendly.
+    """
+    for c in cols:
+        if c not in df.columns:
+            continue
+        df[c] = np.ascontiguousarray(df[c].to_numpy())
+    return df
+
+
+# Bump whenever the loaders' output changes so existing caches are rebuilt
+CACHE_VERSION = 4
+
+
+def cache_path(results_dir, name, files):
+    """Feather cache path keyed by the loader format and the source mtimes."""
+    key = (
+        CACHE_VERSION,
+        CLIENT_COLUMN_TYPES,
+        SERVER_COLUMN_TYPES,
+        sorted((f, os.path.getmtime(f)) for f in files),
+    )
+    sig = hashlib.sha1(repr(key).encode()).hexdigest()
+    return os.path.join(results_dir, f".plot_cache_{name}_{sig}.feather")
+
+
+def read_cache(path):
+    """Load a cached frame, or None if there is no usable cache."""
+    if not os.path.exists(path):
+        return None
+    try:
+        df = pd.read_feather(path)
+        return contiguous_columns(df, df.columns)  # caches are all-numeric
+    except Exception as e:
+        print(f"  ⚠ Ignoring unreadable cache {path}: {e}")
+        return None
+
+
+def write_cache(df, path):
+    """Write `df` to `path` and drop caches for older versions of the inputs."""
+    prefix = os.path.basename(path).rsplit("_", 1)[0]
+    try:
+        df.to_feather(path)
+        pattern = os.path.join(os.path.dirname(path), f"{prefix}_*.feather")
+        for stale in glob.glob(pattern):
+            if stale != path:
+                os.remove(stale)
+    except Exception as e:
+        print(f"  ⚠ Could not write cache {path}: {e}")
+
+
+# Buffered per-batch rows before read_client_table merges them
+COMPACT_ROWS = 1_000_000
+
+
+SUM_OPTIONS = pc.ScalarAggregateOptions(min_count=0)
+
+
+def group_by_timestamp(table, aggs):
+    """Aggregate `table` per timestamp; `aggs` holds (column, func, out_name)."""
+    # min_count=0: a timestamp whose values are all null sums to 0, not null
+    out = table.group_by("timestamp").aggregate([
+        (c, fn, SUM_OPTIONS) if fn == "sum" else (c, fn) for c, fn, _ in aggs
+    ])
+    names = {f"{c}_{fn}": name for c, fn, name in aggs}
+    return out.rename_columns([names.get(c, c) for c in out.column_names])
+
+
+def read_client_table(worker_idx, path):
+    """Read one client CSV, tagged with its worker index (None on failure).
+
+    The file is streamed in record batches, each reduced to one row per
+    timestamp before it is kept, so files with several samples per second
+    never hold their raw rows in memory at once.
+    """
+    try:
+        reader = pv.open_csv(path, **csv_options(CLIENT_COLUMN_TYPES))
+        if "timestamp" not in reader.schema.names:
+            return None
+        # Early aggregation: one row per timestamp before the global concat.
+        # The cumulative tx_pixels counter also keeps its first (min) and
+        # last (max) value so the per-second rate can be derived afterwards.
+        num_cols = [c for c in CLIENT_NUM_COLS if c in reader.schema.names]
+        batch_aggs = [(c, "sum", c) for c in num_cols]
+        merge_aggs = list(batch_aggs)
+        if "tx_pixels" in num_cols:
+            batch_aggs += [
+                ("tx_pixels", "min", "tx_pixels_first"),
+                ("tx_pixels", "max", "tx_pixels_last"),
+            ]
+            merge_aggs += [
+                ("tx_pixels_first", "min", "tx_pixels_first"),
+                ("tx_pixels_last", "max", "tx_pixels_last"),
+            ]
+
+        # Batch partials are buffered and merged only once they outgrow the
+        # running aggregate, so the total merge work stays linear in rows.
+        # The exporter writes one row per second in time order; batches that
+        # keep to that are already reduced and skip the hash aggregation.
+        table = group_by_timestamp(reader.schema.empty_table(), batch_aggs)
+        pending, pending_rows = [], 0
+        needs_merge, last_ts = False, None
+        for batch in reader:
+            ts = batch.column("timestamp")
+            if len(ts) == 0:
+                continue
+            in_order = (last_ts is None or ts[0].as_py() > last_ts) and (
+                len(ts) == 1 or pc.all(pc.greater(ts[1:], ts[:-1])).as_py()
+            )
+            last_ts = ts[-1].as_py() if in_order else None
+            if in_order and not needs_merge:
+                columns = {"timestamp": ts}
+                for c, fn, name in batch_aggs:
+                    col = batch.column(c).cast(table.schema.field(name).type)
+                    # Same null handling as the summing path
+                    columns[name] = pc.fill_null(col, 0) if fn == "sum" else col
+                partial = pa.table(columns).select(table.schema.names)
+            else:
+                needs_merge = True
+                partial = group_by_timestamp(pa.Table.from_batches([batch]), batch_aggs)
+            pending.append(partial)
+            pending_rows += partial.num_rows
+            if needs_merge and pending_rows > max(COMPACT_ROWS, table.num_rows):
+                table = group_by_timestamp(
+                    pa.concat_tables([table, *pending]), merge_aggs
+                )
+                pending, pending_rows = [], 0
+        table = pa.concat_tables([table, *pending])
+        if needs_merge:
+            table = group_by_timestamp(table, merge_aggs)
+
+        worker = pa.array(np.full(table.num_rows, worker_idx, dtype=np.int32))
+        return table.append_column("worker", worker)
+    except Exception as e:
+        print(f"  ⚠ Error reading {path}: {e}")
+        return None
+
+
 def load_client_data(results_dir):
     """Load and merge client CSV files."""
     patterns = [
@@ -122,33 +355,96 @@ def load_client_data(results_dir):
         print(f"⚠ No client CSV files found in {results_dir}")
         return None
 
-    dfs = []
-    for f in files:
-        try:
-            df = pd.read_csv(f)
-            if "timestamp" not in df.columns:
-                continue
-            df = df.sort_values("timestamp")
-            # Calculate per-second rates from cumulative counters
-            if "tx_pixels" in df.columns:
-                df["tx_pixels_s"] = df["tx_pixels"].diff().fillna(0).clip(lower=0)
-            dfs.append(df)
-        except Exception as e:
-            print(f"  ⚠ Error reading {f}: {e}")
-
-    if not dfs:
+    cache = cache_path(results_dir, "client", files)
+    agg = read_cache(cache)
+    if agg is not None:
+        print(
+            f"  ✓ Loaded {len(files)} client CSV files from cache "
+            f"({len(agg)} data points)"
+        )
+        return agg
+
+    # Arrow releases the GIL while parsing, so threads overlap I/O and parse
+    with ThreadPoolExecutor(max_workers=min(32, len(files))) as ex:
+        tables = list(ex.map(read_client_table, range(len(files)), files))
+    tables = [t for t in tables if t is not None]
+
+    if not tables:
+        return None
+
+    # Concatenate at the Arrow level (chunk pointers, no per-column copy) and
+    # keep ArrowDtype columns: numpy is only materialized for the aggregate.
+    if len(tables) == 1:
+        table = tables[0]
+    else:
+        table = pa.concat_tables(tables, promote_options="default")
+    combined = table.to_pandas(types_mapper=pd.ArrowDtype)
+    combined["worker"] = pd.Categorical.from_codes(
+        combined["worker"].to_numpy(), categories=files
+    )
+
+    if combined.empty:
+        print(f"⚠ Client CSV files in {results_dir} contain no data rows")
         return None
 
-    combined = pd.concat(dfs, ignore_index=True)
-    # Aggregate per timestamp across all workers
-    numeric_cols = combined.select_dtypes(include="number").columns
-    cols_to_sum = numeric_cols.drop("timestamp", errors="ignore")
-    agg = combined.groupby("timestamp")[cols_to_sum].sum().reset_index()
+    # Calculate per-second rates from cumulative counters, per worker:
+    # a single diff over the (worker, timestamp)-sorted buffer.
+    if "tx_pixels_last" in combined.columns:
+        combined = combined.sort_values(["worker", "timestamp"])
+        # Workers whose CSV lacks tx_pixels have nulls here: like the
+        # diff().fillna(0) it replaces, any step touching a null rates 0.
+        valid = combined["tx_pixels_last"].notna().to_numpy()
+        last = combined["tx_pixels_last"].fillna(0).to_numpy(dtype=np.int64)
+        first = combined["tx_pixels_first"].fillna(0).to_numpy(dtype=np.int64)
+        codes = combined["worker"].cat.codes.to_numpy()
+        rate = np.empty_like(last)
+        np.subtract(last[1:], last[:-1], out=rate[1:])
+        rate[1:][~valid[:-1]] = 0
+        # A worker's first second only has its own intra-second increments
+        starts = np.empty(len(codes), dtype=bool)
+        starts[0] = True
+        np.not_equal(codes[1:], codes[:-1], out=starts[1:])
+        rate[starts] = last[starts] - first[starts]
+        rate[~valid] = 0
+        np.maximum(rate, 0, out=rate)
+        combined["tx_pixels_s"] = rate
+        combined = combined.drop(columns=["tx_pixels_first", "tx_pixels_last"])
+
+    # Aggregate per timestamp across all workers: one sorted-segment
+    # reduction over the whole numeric block instead of a hash groupby.
+    cols_to_sum = [c for c in CLIENT_NUM_COLS if c in combined.columns]
+    combined = combined.sort_values("timestamp", kind="stable")
+    if len(tables) == 1:
+        # Single worker: pre-aggregation already left one row per timestamp
+        agg = combined[["timestamp", *cols_to_sum]].reset_index(drop=True)
+    else:
+        ts = combined["timestamp"].to_numpy()
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(ts)) + 1))
+        agg = pd.DataFrame({"timestamp": ts[starts]})
+        # Counters are reduced as int64 and rates as float64, so the dtypes
+        # match the single-worker path and counters stay integral. Nulls
+        # (a column missing from some workers' CSVs) count as 0.
+        int_cols = [
+            c for c in cols_to_sum if pd.api.types.is_integer_dtype(combined[c])
+        ]
+        float_cols = [c for c in cols_to_sum if c not in int_cols]
+        for cols, dtype in ((int_cols, np.int64), (float_cols, np.float64)):
+            if cols:
+                vals = np.ascontiguousarray(
+                    combined[cols].fillna(0).to_numpy(dtype=dtype)
+                )
+                agg[cols] = np.add.reduceat(vals, starts, axis=0)
+        agg = agg[["timestamp", *cols_to_sum]]
+    agg = contiguous_columns(agg, agg.columns)
 
     # Create relative time in seconds
     t0 = agg["timestamp"].min()
     agg["elapsed_s"] = agg["timestamp"] - t0
 
+    # Never cache a partial aggregate: the key would keep serving it
+    if len(tables) == len(files):
+        write_cache(agg, cache)
+
     print(f"  ✓ Loaded {len(files)} client CSV files ({len(agg)} data points)")
     return agg
 
@@ -161,13 +457,28 @@ def load_server_data(results_dir):
     ]
     for p in patterns:
         if os.path.exists(p):
+            cache = cache_path(results_dir, "server", [p])
+            df = read_cache(cache)
+            if df is not None:
+                print(f"  ✓ Loaded server metrics from cache ({len(df)} data points)")
+                return df
             try:
-                df = pd.read_csv(p)
-                if "timestamp" not in df.columns:
+                # Parse wide, then narrow: one out-of-range gauge (e.g. a
+                # huge VSZ) must not make the whole file fail to convert.
+                table = read_csv_table(
+                    p, {c: pa.int64() for c in SERVER_COLUMN_TYPES}
+                )
+                if "timestamp" not in table.column_names:
                     print(f"  ⚠ server_metrics.csv missing 'timestamp' column")
                     return None
+                table = narrow_columns(table, SERVER_COLUMN_TYPES)
+                df = contiguous_columns(
+                    table.to_pandas(types_mapper=pd.ArrowDtype),
+                    ("timestamp", *SERVER_NUM_COLS),
+                )
                 t0 = df["timestamp"].min()
                 df["elapsed_s"] = df["timestamp"] - t0
+                write_cache(df, cache)
                 print(f"  ✓ Loaded server metrics ({len(df)} data points)")
                 return df
             except Exception as e:
@@ -177,8 +488,39 @@ def load_server_data(results_dir):
     return None
 
 
+def client_stats(client_df):
+    """Summary stats for the client report, computed in one pass.
+
+    Averages cover the last 60% of the run ("steady state").
+    """
+    ss_mean = client_df.iloc[int(len(client_df) * 0.4):].mean(numeric_only=True)
+    tx_col = next(
+        (c for c in ("tx_pps", "tx_pixels_s") if c in client_df.columns), None
+    )
+    return {
+        "tx_col": tx_col,
+        "avg_tx": ss_mean[tx_col] if tx_col is not None else None,
+        "avg_rx": ss_mean.get("rx_dgram_s"),
+        "peak_conn": client_df["active"].max(),
+        "failed": client_df["failed"].max() if "failed" in client_df.columns else None,
+        "duration": client_df["elapsed_s"].max(),
+    }
+
+
 # ── Plotting ─────────────────────────────────────────────────────────
 
+# ~Screen resolution of an 18in-wide figure at 300 DPI split across panels
+MAX_PLOT_POINTS = 4000
+
+
+def downsample(df, n=MAX_PLOT_POINTS):
+    """Stride-decimate rows to at most `n` evenly spaced points (keeps ends)."""
+    if len(df) <= n:
+        return df
+    idx = np.linspace(0, len(df) - 1, n).astype(np.int64)
+    return df.iloc[idx]
+
+
 def plot_panel_connections(ax, client_df):
     """Panel 1: Client connections over time."""
     ax.fill_between(
@@ -211,24 +553,25 @@ def plot_panel_connections(ax, client_df):
     )
 
 
-def plot_panel_throughput(ax, client_df):
+def plot_panel_throughput(ax, client_df, stats):
     """Panel 2: TX/RX throughput."""
-    if "tx_pps" in client_df.columns:
-        ax.plot(
-            client_df["elapsed_s"], client_df["tx_pps"],
+    pts = downsample(client_df)
+    x = pts["elapsed_s"].to_numpy()
+    # Known static layout: add artists directly and autoscale once
+    tx_col = stats["tx_col"]
+    if tx_col is not None:
+        ax.add_line(Line2D(
+            x, pts[tx_col].to_numpy(),
             color=PALETTE["tx_pixels"], linewidth=1.5, label="TX Pixels/s",
-        )
-    elif "tx_pixels_s" in client_df.columns:
-        ax.plot(
-            client_df["elapsed_s"], client_df["tx_pixels_s"],
-            color=PALETTE["tx_pixels"], linewidth=1.5, label="TX Pixels/s",
-        )
+        ))
 
     if "rx_dgram_s" in client_df.columns:
-        ax.plot(
-            client_df["elapsed_s"], client_df["rx_dgram_s"],
+        ax.add_line(Line2D(
+            x, pts["rx_dgram_s"].to_numpy(),
             color=PALETTE["rx_dgram"], linewidth=1.5, label="RX Datagrams/s",
-        )
+        ))
+    ax.relim()
+    ax.autoscale_view()
 
     ax.set_title("Client Throughput")
     ax.set_ylabel("Messages / second")
@@ -236,15 +579,9 @@ def plot_panel_throughput(ax, client_df):
     ax.legend(loc="upper left")
 
     # Annotate average steady-state throughput
-    if "tx_pps" in client_df.columns:
-        col = "tx_pps"
-    elif "tx_pixels_s" in client_df.columns:
-        col = "tx_pixels_s"
-    else:
+    if tx_col is None:
         return
-    # Use last 60% of data as "steady state"
-    ss = client_df.iloc[int(len(client_df) * 0.4):]
-    avg = ss[col].mean()
+    avg = stats["avg_tx"]
     ax.axhline(avg, color=PALETTE["tx_pixels"], linestyle=":", alpha=0.5, linewidth=1)
     ax.text(
         client_df["elapsed_s"].max() * 0.02, avg * 1.08,
@@ -255,12 +592,13 @@ def plot_panel_throughput(ax, client_df):
 
 def plot_panel_udp_health(ax, server_df):
     """Panel 3: Server UDP health (datagrams in/s and errors)."""
+    pts = downsample(server_df)
     ax.plot(
-        server_df["elapsed_s"], server_df["udp_in_dgrams"],
+        pts["elapsed_s"], pts["udp_in_dgrams"],
         color=PALETTE["udp_in"], linewidth=1.5, label="UDP In/s",
     )
     ax.plot(
-        server_df["elapsed_s"], server_df["udp_out_dgrams"],
+        pts["elapsed_s"], pts["udp_out_dgrams"],
         color=PALETTE["tx_pixels"], linewidth=1.2, alpha=0.7, label="UDP Out/s",
     )
 
@@ -271,15 +609,17 @@ def plot_panel_udp_health(ax, server_df):
     )
     if has_errors:
         ax2 = ax.twinx()
-        ax2.bar(
-            server_df["elapsed_s"], server_df["udp_rcvbuf_errors"],
-            color=PALETTE["udp_errors"], alpha=0.6, width=0.8, label="RcvbufErr/s",
+        # Step-filled areas: one artist per series instead of a bar per sample
+        t = server_df["elapsed_s"]
+        rcvbuf = server_df["udp_rcvbuf_errors"]
+        ax2.fill_between(
+            t, 0, rcvbuf, step="pre",
+            color=PALETTE["udp_errors"], alpha=0.6, label="RcvbufErr/s",
         )
         if server_df["udp_sndbuf_errors"].sum() > 0:
-            ax2.bar(
-                server_df["elapsed_s"], server_df["udp_sndbuf_errors"],
-                color="#FF9800", alpha=0.5, width=0.8,
-                bottom=server_df["udp_rcvbuf_errors"], label="SndBufErr/s",
+            ax2.fill_between(
+                t, rcvbuf, rcvbuf + server_df["udp_sndbuf_errors"], step="pre",
+                color="#FF9800", alpha=0.5, label="SndBufErr/s",
             )
         ax2.set_ylabel("Errors / sec", color=PALETTE["udp_errors"])
         ax2.tick_params(axis="y", labelcolor=PALETTE["udp_errors"])
@@ -291,23 +631,24 @@ def plot_panel_udp_health(ax, server_df):
     ax.legend(loc="upper left")
 
 
+CPU_COLS = [
+    "cpu_user", "cpu_nice", "cpu_system", "cpu_idle",
+    "cpu_iowait", "cpu_irq", "cpu_softirq",
+]
+
+
 def plot_panel_cpu(ax, server_df):
     """Panel 4: Server CPU utilization (stacked area)."""
-    # CPU jiffies → percentage
-    total = (
-        server_df["cpu_user"] + server_df["cpu_nice"] + server_df["cpu_system"]
-        + server_df["cpu_idle"] + server_df["cpu_iowait"]
-        + server_df["cpu_irq"] + server_df["cpu_softirq"]
-    ).replace(0, 1)  # avoid division by zero
-
-    pct_user = server_df["cpu_user"] / total * 100
-    pct_sys = server_df["cpu_system"] / total * 100
-    pct_sirq = server_df["cpu_softirq"] / total * 100
-    pct_idle = server_df["cpu_idle"] / total * 100
+    pts = downsample(server_df)
+    # CPU jiffies → percentage, in one pass over the (rows × CPU_COLS) block
+    arr = pts[CPU_COLS].to_numpy(dtype=np.float32)
+    total = arr.sum(axis=1, keepdims=True)
+    np.maximum(total, 1, out=total)  # avoid division by zero
+    pct = arr * (100.0 / total)
 
     ax.stackplot(
-        server_df["elapsed_s"],
-        pct_user, pct_sys, pct_sirq, pct_idle,
+        pts["elapsed_s"],
+        pct[:, 0], pct[:, 2], pct[:, 6], pct[:, 3],  # user, system, softirq, idle
         labels=["User", "System", "Softirq", "Idle"],
         colors=[PALETTE["cpu_user"], PALETTE["cpu_system"],
                 PALETTE["cpu_softirq"], PALETTE["cpu_idle"]],
@@ -345,12 +686,13 @@ def plot_panel_memory(ax, server_df):
 
 def plot_panel_network(ax, server_df):
     """Panel 6: Network I/O (bytes/s and packets/s)."""
+    pts = downsample(server_df)
     ax.plot(
-        server_df["elapsed_s"], server_df["net_rx_bytes"],
+        pts["elapsed_s"], pts["net_rx_bytes"],
         color=PALETTE["net_rx"], linewidth=1.5, label="RX",
     )
     ax.plot(
-        server_df["elapsed_s"], server_df["net_tx_bytes"],
+        pts["elapsed_s"], pts["net_tx_bytes"],
         color=PALETTE["net_tx"], linewidth=1.5, label="TX",
     )
     ax.set_title("Network I/O (bytes/s)")
@@ -362,12 +704,12 @@ def plot_panel_network(ax, server_df):
     # Packets/s on twin axis
     ax2 = ax.twinx()
     ax2.plot(
-        server_df["elapsed_s"], server_df["net_rx_packets"],
+        pts["elapsed_s"], pts["net_rx_packets"],
         color=PALETTE["rx_pkts"], linewidth=1, alpha=0.5, linestyle=":",
         label="RX Pkts/s",
     )
     ax2.plot(
-        server_df["elapsed_s"], server_df["net_tx_packets"],
+        pts["elapsed_s"], pts["net_tx_packets"],
         color=PALETTE["tx_pkts"], linewidth=1, alpha=0.5, linestyle=":",
         label="TX Pkts/s",
     )
@@ -376,31 +718,19 @@ def plot_panel_network(ax, server_df):
     ax2.legend(loc="upper right", fontsize=8)
 
 
-def add_summary_box(fig, client_df=None, server_df=None):
-    """Add a summary stats text box to the figure."""
+def add_summary_box(fig, stats=None, server_df=None):
+    """Add a summary stats text box to the figure (`stats` from client_stats)."""
     lines = []
 
-    if client_df is not None:
-        peak_conn = client_df["active"].max()
-        lines.append(f"Peak Connections: {human_format(peak_conn)}")
-
-        # Average steady-state throughput (last 60%)
-        ss = client_df.iloc[int(len(client_df) * 0.4):]
-        for col in ["tx_pps", "tx_pixels_s"]:
-            if col in ss.columns:
-                avg_tx = ss[col].mean()
-                lines.append(f"Avg TX: {human_format(avg_tx)}/s")
-                break
-        if "rx_dgram_s" in ss.columns:
-            avg_rx = ss["rx_dgram_s"].mean()
-            lines.append(f"Avg RX: {human_format(avg_rx)}/s")
-
-        if "failed" in client_df.columns:
-            total_failed = client_df["failed"].max()
-            lines.append(f"Failed: {int(total_failed)}")
-
-        duration = client_df["elapsed_s"].max()
-        lines.append(f"Duration: {int(duration)}s")
+    if stats is not None:
+        lines.append(f"Peak Connections: {human_format(stats['peak_conn'])}")
+        if stats["avg_tx"] is not None:
+            lines.append(f"Avg TX: {human_format(stats['avg_tx'])}/s")
+        if stats["avg_rx"] is not None:
+            lines.append(f"Avg RX: {human_format(stats['avg_rx'])}/s")
+        if stats["failed"] is not None:
+            lines.append(f"Failed: {int(stats['failed'])}")
+        lines.append(f"Duration: {int(stats['duration'])}s")
 
     if server_df is not None:
         total_rcvbuf_err = server_df["udp_rcvbuf_errors"].sum()
@@ -432,6 +762,67 @@ def add_summary_box(fig, client_df=None, server_df=None):
 
 # ── Main ─────────────────────────────────────────────────────────────
 
+def save_figure(fig, png_path, svg_path):
+    """Save `fig` as PNG (300 DPI) and SVG.
+
+    Margins come from the caller's tight_layout(), so no bbox_inches="tight"
+    measurement pass is needed on either save.
+    """
+    fig.savefig(png_path, dpi=300, bbox_inches=None, facecolor=BG_COLOR)
+    fig.savefig(svg_path, bbox_inches=None, facecolor=BG_COLOR)
+
+
+def render_server(server_df, results_dir):
+    """Build and save the server figure; returns (png_path, svg_path)."""
+    setup_style()
+    fig_s, axes_s = plt.subplots(2, 2, figsize=(18, 11))
+    axes_flat_s = axes_s.flatten()
+    plot_panel_udp_health(axes_flat_s[0], server_df)
+    plot_panel_cpu(axes_flat_s[1], server_df)
+    plot_panel_memory(axes_flat_s[2], server_df)
+    plot_panel_network(axes_flat_s[3], server_df)
+
+    add_summary_box(fig_s, server_df=server_df)
+
+    fig_s.suptitle(
+        "Canvas Server — Benchmark Report",
+        fontsize=18, fontweight="bold", color=PALETTE["text"],
+        y=0.995,
+    )
+
+    fig_s.tight_layout(rect=[0, 0, 0.85, 0.97])
+
+    s_png_path = os.path.join(results_dir, "benchmark_server_report.png")
+    s_svg_path = os.path.join(results_dir, "benchmark_server_report.svg")
+    save_figure(fig_s, s_png_path, s_svg_path)
+    plt.close(fig_s)
+    return s_png_path, s_svg_path
+
+
+def render_client(client_df, stats, results_dir):
+    """Build and save the client figure; returns (png_path, svg_path)."""
+    setup_style()
+    fig_c, axes_c = plt.subplots(1, 2, figsize=(18, 5))
+    plot_panel_connections(axes_c[0], client_df)
+    plot_panel_throughput(axes_c[1], client_df, stats)
+
+    add_summary_box(fig_c, stats=stats)
+
+    fig_c.suptitle(
+        "Canvas Client — Benchmark Report",
+        fontsize=18, fontweight="bold", color=PALETTE["text"],
+        y=0.995,
+    )
+
+    fig_c.tight_layout(rect=[0, 0, 0.85, 0.97])
+
+    c_png_path = os.path.join(results_dir, "benchmark_client_report.png")
+    c_svg_path = os.path.join(results_dir, "benchmark_client_report.svg")
+    save_figure(fig_c, c_png_path, c_svg_path)
+    plt.close(fig_c)
+    return c_png_path, c_svg_path
+
+
 def plot(results_dir):
     """Generate the full benchmark report."""
     print(f"\n{'═' * 60}")
@@ -446,60 +837,29 @@ def plot(results_dir):
         print("\n✗ No data found. Nothing to plot.")
         sys.exit(1)
 
-    setup_style()
-
-    png_paths = []
+    stats = client_stats(client_df) if client_df is not None else None
 
+    jobs = []
     if server_df is not None:
-        fig_s, axes_s = plt.subplots(2, 2, figsize=(18, 11))
-        axes_flat_s = axes_s.flatten()
-        plot_panel_udp_health(axes_flat_s[0], server_df)
-        plot_panel_cpu(axes_flat_s[1], server_df)
-        plot_panel_memory(axes_flat_s[2], server_df)
-        plot_panel_network(axes_flat_s[3], server_df)
-
-        add_summary_box(fig_s, server_df=server_df)
-
-        fig_s.suptitle(
-            "Canvas Server — Benchmark Report",
-            fontsize=18, fontweight="bold", color=PALETTE["text"],
-            y=0.995,
-        )
-
-        fig_s.tight_layout(rect=[0, 0, 0.85, 0.97])
-
-        s_png_path = os.path.join(results_dir, "benchmark_server_report.png")
-        s_svg_path = os.path.join(results_dir, "benchmark_server_report.svg")
-        fig_s.savefig(s_png_path, dpi=300, bbox_inches="tight", facecolor=BG_COLOR)
-        fig_s.savefig(s_svg_path, bbox_inches="tight", facecolor=BG_COLOR)
-
-        print(f"\n  ✓ Server PNG: {s_png_path}")
-        print(f"  ✓ Server SVG: {s_svg_path}")
-        png_paths.append(s_png_path)
-
+        jobs.append(("Server", render_server, (server_df, results_dir)))
     if client_df is not None:
-        fig_c, axes_c = plt.subplots(1, 2, figsize=(18, 5))
-        plot_panel_connections(axes_c[0], client_df)
-        plot_panel_throughput(axes_c[1], client_df)
-
-        add_summary_box(fig_c, client_df=client_df)
-
-        fig_c.suptitle(
-            "Canvas Client — Benchmark Report",
-            fontsize=18, fontweight="bold", color=PALETTE["text"],
-            y=0.995,
-        )
-
-        fig_c.tight_layout(rect=[0, 0, 0.85, 0.97])
-
-        c_png_path = os.path.join(results_dir, "benchmark_client_report.png")
-        c_svg_path = os.path.join(results_dir, "benchmark_client_report.svg")
-        fig_c.savefig(c_png_path, dpi=300, bbox_inches="tight", facecolor=BG_COLOR)
-        fig_c.savefig(c_svg_path, bbox_inches="tight", facecolor=BG_COLOR)
+        jobs.append(("Client", render_client, (client_df, stats, results_dir)))
+
+    # The two figures are independent: render each in its own process so
+    # Agg rasterization runs on separate cores. A single figure is rendered
+    # inline rather than paying process start-up and pickling for nothing.
+    if len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=len(jobs)) as ex:
+            futures = [ex.submit(fn, *args) for _, fn, args in jobs]
+            results = [f.result() for f in futures]
+    else:
+        results = [fn(*args) for _, fn, args in jobs]
 
-        print(f"\n  ✓ Client PNG: {c_png_path}")
-        print(f"  ✓ Client SVG: {c_svg_path}")
-        png_paths.append(c_png_path)
+    png_paths = []
+    for (label, _, _), (png_path, svg_path) in zip(jobs, results):
+        print(f"\n  ✓ {label} PNG: {png_path}")
+        print(f"  ✓ {label} SVG: {svg_path}")
+        png_paths.append(png_path)
 
     print(f"\n{'═' * 60}\n")
 